@@ -2,37 +2,220 @@ import FreeCAD
 import FreeCADGui
 import ObjectsFem
 
+import collections
 import contextlib
-import queue
+import functools
 import base64
 import io
+import json
 import os
+import re
+import socket
+import socketserver
 import tempfile
 import threading
+import weakref
 from dataclasses import dataclass, field
 from typing import Any
-from xmlrpc.server import SimpleXMLRPCServer
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
 
-from PySide import QtCore
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from PySide import QtCore, QtGui
 
 from .parts_library import get_parts_list, insert_part_from_library
 from .serialize import serialize_object
 
+# Bound once; these are used for every property assignment
+Vector = FreeCAD.Vector
+Placement = FreeCAD.Placement
+Rotation = FreeCAD.Rotation
+
+# Per-request informational messages go to the Report view only when
+# FREECAD_MCP_VERBOSE is set; errors and warnings are always printed.
+_VERBOSE = os.environ.get("FREECAD_MCP_VERBOSE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _log(msg: str) -> None:
+    if _VERBOSE:
+        FreeCAD.Console.PrintMessage(msg)
+
+
 rpc_server_thread = None
 rpc_server_instance = None
+gui_dispatcher = None
+
+# View.saveImage() only writes to a path, so keep those files on tmpfs when
+# the platform has one; None falls back to the default temp directory.
+_SCREENSHOT_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# saveImage() picks the encoder from the file extension but takes no quality
+# argument, so the view is captured losslessly and _read_screenshot() encodes
+# every capture to JPEG itself; the client advertises it as image/jpeg.
+_SCREENSHOT_SUFFIX = ".png"
+
+# Longest edge, in pixels, of screenshots sent to the client, for both the
+# active view and the Nodes workbench; larger captures (e.g. on high-DPI
+# screens) are scaled down. 0 disables the limit.
+_SCREENSHOT_DEFAULT_MAX_DIM = 1280
+
+
+def _screenshot_max_dim() -> int:
+    value = os.environ.get("FREECAD_MCP_MAX_SCREENSHOT_DIM", str(_SCREENSHOT_DEFAULT_MAX_DIM)).strip()
+    if not value:
+        return 0
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        FreeCAD.Console.PrintWarning(
+            f"Ignoring invalid FREECAD_MCP_MAX_SCREENSHOT_DIM={value!r}; "
+            f"using {_SCREENSHOT_DEFAULT_MAX_DIM}\n"
+        )
+        return _SCREENSHOT_DEFAULT_MAX_DIM
+
+
+_SCREENSHOT_MAX_DIM = _screenshot_max_dim()
+
+
+# Qt maps PNG "quality" to zlib effort: 80 is a fast, low compression level.
+# Node editor captures are flat UI that compresses well even so.
+_NODES_SCREENSHOT_PNG_QUALITY = 80
+
+# JPEG quality of active view screenshots, whether or not they are scaled.
+# A shaded 3D view at 85 is several times smaller than the PNG with no
+# visible artifacts, which keeps the base64 payload small.
+_SCREENSHOT_JPEG_QUALITY = 85
+
+
+def _encode_image(image, fmt: str, quality: int = -1) -> bytes | None:
+    """Encode a QImage in memory; returns None if Qt cannot encode it."""
+    data = QtCore.QByteArray()
+    buffer = QtCore.QBuffer(data)
+    buffer.open(QtCore.QIODevice.WriteOnly)
+    saved = image.save(buffer, fmt, quality)
+    buffer.close()
+    return bytes(data.data()) if saved else None
+
+
+def _read_screenshot(path: str) -> bytes | None:
+    """Return the capture at ``path`` as JPEG, scaled to ``_SCREENSHOT_MAX_DIM``.
+
+    Returns None if Qt cannot decode or encode the image.
+    """
+    reader = QtGui.QImageReader(path)
+    if _SCREENSHOT_MAX_DIM > 0:
+        # Only the header is read to get the size. Qt's PNG handler cannot
+        # scale while decoding, so the reader decodes at full size and then
+        # scales the image down
+        size = reader.size()
+        if size.isValid() and max(size.width(), size.height()) > _SCREENSHOT_MAX_DIM:
+            reader.setScaledSize(size.scaled(_SCREENSHOT_MAX_DIM, _SCREENSHOT_MAX_DIM, QtCore.Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    return _encode_image(image, "JPG", _SCREENSHOT_JPEG_QUALITY)
+
+# View name accepted by get_active_screenshot -> View3DInventor method
+_VIEW_METHODS = {
+    "Isometric": "viewIsometric",
+    "Front": "viewFront",
+    "Top": "viewTop",
+    "Right": "viewRight",
+    "Back": "viewBack",
+    "Left": "viewLeft",
+    "Bottom": "viewBottom",
+    "Dimetric": "viewDimetric",
+    "Trimetric": "viewTrimetric",
+}
+
+# View types that cannot be captured even if they expose saveImage
+_UNSUPPORTED_VIEW_TYPES = frozenset(
+    {"SpreadsheetGui::SheetView", "DrawingGui::DrawingView", "TechDrawGui::MDIViewPage"}
+)
 
-# GUI task queue
-rpc_request_queue = queue.Queue()
-rpc_response_queue = queue.Queue()
+# View class -> whether get_active_screenshot can capture it
+_VIEW_SCREENSHOT_SUPPORT: dict[type, bool] = {}
+
+# Node editor widget found by the last allWidgets() scan
+_nodes_widget_ref: weakref.ref | None = None
+
+# Keywords used to recognise node editor widgets and windows
+_NODE_CLASS_KEYWORDS = ('node', 'graph', 'scene')
+_NODE_MODULE_KEYWORDS = ('node', 'graph')
+_NODE_TITLE_KEYWORDS = ('node', 'graph', 'visual', 'scripting')
+
+# GUI task queue. deque.append/popleft are atomic, so RPC threads can post
+# and the GUI thread can drain without taking a lock per task.
+rpc_request_queue = collections.deque()
+
+
+class _Call:
+    """A GUI task together with the slot its result is delivered through."""
+
+    __slots__ = ("fn", "result", "error", "event")
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.result = None
+        self.error = None
+        self.event = threading.Event()
+
+
+# Upper bound on the tasks run per GUI wakeup, so a burst of RPC calls is
+# drained in one pass without starving the Qt event loop.
+MAX_GUI_BATCH = 64
 
 
 def process_gui_tasks():
-    while not rpc_request_queue.empty():
-        task = rpc_request_queue.get()
-        res = task()
-        if res is not None:
-            rpc_response_queue.put(res)
-    QtCore.QTimer.singleShot(500, process_gui_tasks)
+    for _ in range(MAX_GUI_BATCH):
+        if not rpc_request_queue:
+            return
+        call = rpc_request_queue.popleft()
+        try:
+            call.result = call.fn()
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"GUI task failed: {e}\n")
+            call.error = e
+        finally:
+            call.event.set()
+    # Let Qt process other events before running the rest of the backlog
+    if rpc_request_queue:
+        gui_dispatcher.trigger.emit()
+
+
+class GuiDispatcher(QtCore.QObject):
+    """Runs queued RPC tasks on the GUI thread as soon as they are posted.
+
+    Must be created on the GUI thread. ``trigger`` may be emitted from any
+    thread; the queued connection delivers it to the GUI event loop.
+    """
+
+    trigger = QtCore.Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.trigger.connect(self.process_gui_tasks, QtCore.Qt.QueuedConnection)
+
+    @QtCore.Slot()
+    def process_gui_tasks(self):
+        process_gui_tasks()
+
+
+def run_in_gui(fn):
+    """Run ``fn`` on the GUI thread and block until its result is available.
+
+    An exception raised by ``fn`` is re-raised in the calling thread.
+    """
+    call = _Call(fn)
+    rpc_request_queue.append(call)
+    gui_dispatcher.trigger.emit()
+    call.event.wait()
+    if call.error is not None:
+        raise call.error
+    return call.result
 
 
 @dataclass
@@ -43,79 +226,196 @@ class Object:
     properties: dict[str, Any] = field(default_factory=dict)
 
 
+def _object_from_data(obj_data: dict[str, Any]) -> Object:
+    return Object(
+        name=obj_data.get("Name", "New_Object"),
+        type=obj_data["Type"],
+        analysis=obj_data.get("Analysis", None),
+        properties=obj_data.get("Properties", {}),
+    )
+
+
+def _batch_entry_error(index: int, entry: Any, required_key: str) -> str | None:
+    """Describe what is wrong with one entry of a batch call, or return None."""
+    if not isinstance(entry, dict):
+        return f"Entry {index} must be a dict."
+    if not isinstance(entry.get(required_key), str):
+        return f"Entry {index} must have a string '{required_key}'."
+    if not isinstance(entry.get("Properties", {}), dict):
+        return f"Entry {index} has 'Properties' that is not a dict."
+    return None
+
+
+# Largest amount of captured stdout execute_code returns, in characters
+MAX_EXEC_OUTPUT = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_code(source: str):
+    """Compile execute_code() source, reusing the code object for repeated snippets."""
+    return compile(source, "<string>", "exec")
+
+
+class _NodesUnavailableError(Exception):
+    """The Nodes editor scene cannot be reached; the message is user-facing."""
+
+
+def _node_failure(message: str) -> dict[str, Any]:
+    return {"success": False, "node_id": None, "title": None, "message": message}
+
+
+# node_type_op_code -> node class, filled as node types are first resolved
+_NODE_CLASS_CACHE: dict[str, type] = {}
+
+# Matches "<class 'number_number.Number'>" and captures the dotted class path
+_CLASS_REPR_RE = re.compile(r"<class '([^']+)'>")
+
+# Key of the Nodes workbench in FreeCADGui.listWorkbenches(), once found
+_nodes_workbench_key = None
+
+
+def _match_node_class(nodes_store, node_type_op_code: str):
+    # First try direct lookup if it's already an op_code
+    if node_type_op_code in nodes_store.nodes:
+        return nodes_store.nodes[node_type_op_code]
+
+    # Try to find by matching the string representation
+    for op_code, cls in nodes_store.nodes.items():
+        if str(cls) == node_type_op_code or op_code == node_type_op_code:
+            return cls
+
+    # If still not found, try to find by class name or op_title
+    match = _CLASS_REPR_RE.fullmatch(node_type_op_code)
+    if match:
+        class_name = match.group(1).rpartition('.')[2]
+        for cls in nodes_store.nodes.values():
+            if (hasattr(cls, '__name__') and cls.__name__ == class_name) or \
+               (hasattr(cls, 'op_title') and cls.op_title == class_name):
+                return cls
+
+    return None
+
+
+def _find_node_class(nodes_store, node_type_op_code: str):
+    node_class = _NODE_CLASS_CACHE.get(node_type_op_code)
+    if node_class is not None:
+        return node_class
+
+    node_class = _match_node_class(nodes_store, node_type_op_code)
+    if node_class is None:
+        # Load node modules that were not registered yet, then retry
+        nodes_store.refresh_nodes_list()
+        node_class = _match_node_class(nodes_store, node_type_op_code)
+    if node_class is not None:
+        _NODE_CLASS_CACHE[node_type_op_code] = node_class
+    return node_class
+
+
+def resolve_references(doc: FreeCAD.Document, refs: list) -> list[tuple]:
+    """Turn ``[(object_name, sub_element), ...]`` into ``[(object, sub_element), ...]``.
+
+    Each distinct object name is looked up in the document only once.
+    """
+    ref_objs = {name: doc.getObject(name) for name in {ref[0] for ref in refs}}
+    for name, ref_obj in ref_objs.items():
+        if not ref_obj:
+            raise ValueError(f"Referenced object '{name}' not found.")
+    return [(ref_objs[ref_name], face) for ref_name, face in refs]
+
+
+def _to_color(val) -> tuple[float, float, float, float]:
+    return (float(val[0]), float(val[1]), float(val[2]), float(val[3]))
+
+
+def _set_placement(doc, obj, prop, val):
+    if "Base" in val:
+        pos = val["Base"]
+    elif "Position" in val:
+        pos = val["Position"]
+    else:
+        pos = {}
+    rot = val.get("Rotation", {})
+    axis = rot.get("Axis", {})
+    placement = Placement(
+        Vector(
+            pos.get("x", 0),
+            pos.get("y", 0),
+            pos.get("z", 0),
+        ),
+        Rotation(
+            Vector(
+                axis.get("x", 0),
+                axis.get("y", 0),
+                axis.get("z", 1),
+            ),
+            rot.get("Angle", 0),
+        ),
+    )
+    setattr(obj, prop, placement)
+
+
+def _set_linked_object(doc, obj, prop, val):
+    ref_obj = doc.getObject(val)
+    if ref_obj:
+        setattr(obj, prop, ref_obj)
+    else:
+        raise ValueError(f"Referenced object '{val}' not found.")
+
+
+def _set_references(doc, obj, prop, val):
+    setattr(obj, prop, resolve_references(doc, val))
+
+
+def _set_shape_color(doc, obj, prop, val):
+    setattr(obj.ViewObject, prop, _to_color(val))
+
+
+def _set_view_object(doc, obj, prop, val):
+    for k, v in val.items():
+        if k == "ShapeColor":
+            setattr(obj.ViewObject, k, _to_color(v))
+        else:
+            setattr(obj.ViewObject, k, v)
+
+
+# prop -> (accepted value type, setter) for properties of the object itself
+_PROPERTY_SETTERS = {
+    "Placement": (dict, _set_placement),
+    "Base": (str, _set_linked_object),
+    "Tool": (str, _set_linked_object),
+    "Source": (str, _set_linked_object),
+    "Profile": (str, _set_linked_object),
+    "References": (list, _set_references),
+}
+
+# Same, for keys that are not object properties but address the ViewObject
+_VIEW_PROPERTY_SETTERS = {
+    "ShapeColor": ((list, tuple), _set_shape_color),
+    "ViewObject": (dict, _set_view_object),
+}
+
+
 def set_object_property(
     doc: FreeCAD.Document, obj: FreeCAD.DocumentObject, properties: dict[str, Any]
 ):
+    props_set = frozenset(obj.PropertiesList)
     for prop, val in properties.items():
         try:
-            if prop in obj.PropertiesList:
-                if prop == "Placement" and isinstance(val, dict):
-                    if "Base" in val:
-                        pos = val["Base"]
-                    elif "Position" in val:
-                        pos = val["Position"]
-                    else:
-                        pos = {}
-                    rot = val.get("Rotation", {})
-                    placement = FreeCAD.Placement(
-                        FreeCAD.Vector(
-                            pos.get("x", 0),
-                            pos.get("y", 0),
-                            pos.get("z", 0),
-                        ),
-                        FreeCAD.Rotation(
-                            FreeCAD.Vector(
-                                rot.get("Axis", {}).get("x", 0),
-                                rot.get("Axis", {}).get("y", 0),
-                                rot.get("Axis", {}).get("z", 1),
-                            ),
-                            rot.get("Angle", 0),
-                        ),
-                    )
-                    setattr(obj, prop, placement)
-
-                elif isinstance(getattr(obj, prop), FreeCAD.Vector) and isinstance(
-                    val, dict
-                ):
-                    vector = FreeCAD.Vector(
-                        val.get("x", 0), val.get("y", 0), val.get("z", 0)
-                    )
-                    setattr(obj, prop, vector)
-
-                elif prop in ["Base", "Tool", "Source", "Profile"] and isinstance(
-                    val, str
-                ):
-                    ref_obj = doc.getObject(val)
-                    if ref_obj:
-                        setattr(obj, prop, ref_obj)
-                    else:
-                        raise ValueError(f"Referenced object '{val}' not found.")
-
-                elif prop == "References" and isinstance(val, list):
-                    refs = []
-                    for ref_name, face in val:
-                        ref_obj = doc.getObject(ref_name)
-                        if ref_obj:
-                            refs.append((ref_obj, face))
-                        else:
-                            raise ValueError(f"Referenced object '{ref_name}' not found.")
-                    setattr(obj, prop, refs)
-
+            if prop in props_set:
+                setter = _PROPERTY_SETTERS.get(prop)
+                if setter is not None and isinstance(val, setter[0]):
+                    setter[1](doc, obj, prop, val)
+                # Only dict values can describe a vector, so scalars skip the property read
+                elif isinstance(val, dict) and isinstance(getattr(obj, prop), Vector):
+                    setattr(obj, prop, Vector(val.get("x", 0), val.get("y", 0), val.get("z", 0)))
                 else:
                     setattr(obj, prop, val)
-            # ShapeColor is a property of the ViewObject
-            elif prop == "ShapeColor" and isinstance(val, (list, tuple)):
-                setattr(obj.ViewObject, prop, (float(val[0]), float(val[1]), float(val[2]), float(val[3])))
-
-            elif prop == "ViewObject" and isinstance(val, dict):
-                for k, v in val.items():
-                    if k == "ShapeColor":
-                        setattr(obj.ViewObject, k, (float(v[0]), float(v[1]), float(v[2]), float(v[3])))
-                    else:
-                        setattr(obj.ViewObject, k, v)
-
             else:
-                setattr(obj, prop, val)
+                setter = _VIEW_PROPERTY_SETTERS.get(prop)
+                if setter is not None and isinstance(val, setter[0]):
+                    setter[1](doc, obj, prop, val)
+                else:
+                    setattr(obj, prop, val)
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Property '{prop}' assignment error: {e}\n")
@@ -124,58 +424,135 @@ def set_object_property(
 class FreeCADRPC:
     """RPC server for FreeCAD"""
 
+    # ping, list_documents and get_parts_list only read data that the GUI
+    # never mutates, so they answer directly from the RPC worker thread.
+    # Everything that touches a document goes through run_in_gui.
+
     def ping(self):
         return True
 
     def create_document(self, name="New_Document"):
-        rpc_request_queue.put(lambda: self._create_document_gui(name))
-        res = rpc_response_queue.get()
+        res = run_in_gui(lambda: self._create_document_gui(name))
         if res is True:
             return {"success": True, "document_name": name}
         else:
             return {"success": False, "error": res}
 
     def create_object(self, doc_name, obj_data: dict[str, Any]):
-        obj = Object(
-            name=obj_data.get("Name", "New_Object"),
-            type=obj_data["Type"],
-            analysis=obj_data.get("Analysis", None),
-            properties=obj_data.get("Properties", {}),
-        )
-        rpc_request_queue.put(lambda: self._create_object_gui(doc_name, obj))
-        res = rpc_response_queue.get()
+        obj = _object_from_data(obj_data)
+        res = run_in_gui(lambda: self._create_object_gui(doc_name, obj))
         if res is True:
             return {"success": True, "object_name": obj.name}
         else:
             return {"success": False, "error": res}
 
+    def create_objects(
+        self, doc_name, objs_data: list[dict[str, Any]], recompute: bool = True
+    ) -> list[dict[str, Any]]:
+        """Create several objects in one GUI task.
+
+        Each entry takes the same keys as the ``create_object`` data. The
+        document is recomputed once after the whole batch, or not at all when
+        ``recompute`` is false. Returns one result dict per entry, in order;
+        a malformed entry fails on its own without stopping the others.
+        """
+        errors = [_batch_entry_error(i, obj_data, "Type") for i, obj_data in enumerate(objs_data)]
+        objs = [None if error else _object_from_data(obj_data) for error, obj_data in zip(errors, objs_data)]
+
+        def task():
+            results = [
+                error or self._create_object_gui(doc_name, obj, recompute=False)
+                for error, obj in zip(errors, objs)
+            ]
+            if recompute and any(res is True for res in results):
+                doc = FreeCAD.getDocument(doc_name)
+                doc.recompute()
+            return results
+
+        return [
+            {"success": True, "object_name": obj.name} if res is True else {"success": False, "error": res}
+            for obj, res in zip(objs, run_in_gui(task))
+        ]
+
     def edit_object(self, doc_name: str, obj_name: str, properties: dict[str, Any]) -> dict[str, Any]:
         obj = Object(
             name=obj_name,
             properties=properties.get("Properties", {}),
         )
-        rpc_request_queue.put(lambda: self._edit_object_gui(doc_name, obj))
-        res = rpc_response_queue.get()
+        res = run_in_gui(lambda: self._edit_object_gui(doc_name, obj))
         if res is True:
             return {"success": True, "object_name": obj.name}
         else:
             return {"success": False, "error": res}
 
+    def edit_objects(
+        self, doc_name: str, edits: list[dict[str, Any]], recompute: bool = True
+    ) -> list[dict[str, Any]]:
+        """Edit several objects in one GUI task.
+
+        Each edit is ``{"Name": ..., "Properties": {...}}``. The document is
+        recomputed once after the whole batch, or not at all when
+        ``recompute`` is false. Returns one result dict per edit, in order;
+        a malformed edit fails on its own without stopping the others.
+        """
+        errors = [_batch_entry_error(i, edit, "Name") for i, edit in enumerate(edits)]
+        objs = [
+            None if error else Object(name=edit["Name"], properties=edit.get("Properties", {}))
+            for error, edit in zip(errors, edits)
+        ]
+
+        def task():
+            results = [
+                error or self._edit_object_gui(doc_name, obj, recompute=False)
+                for error, obj in zip(errors, objs)
+            ]
+            if recompute and any(res is True for res in results):
+                FreeCAD.getDocument(doc_name).recompute()
+            return results
+
+        return [
+            {"success": True, "object_name": obj.name} if res is True else {"success": False, "error": res}
+            for obj, res in zip(objs, run_in_gui(task))
+        ]
+
     def delete_object(self, doc_name: str, obj_name: str):
-        rpc_request_queue.put(lambda: self._delete_object_gui(doc_name, obj_name))
-        res = rpc_response_queue.get()
+        res = run_in_gui(lambda: self._delete_object_gui(doc_name, obj_name))
         if res is True:
             return {"success": True, "object_name": obj_name}
         else:
             return {"success": False, "error": res}
 
+    def delete_objects(self, doc_name: str, obj_names: list[str]) -> list[dict[str, Any]]:
+        """Delete several objects in one GUI task.
+
+        The document is recomputed once after the whole batch. Returns one
+        result dict per name, in order.
+        """
+        def task():
+            results = [self._delete_object_gui(doc_name, obj_name, recompute=False) for obj_name in obj_names]
+            if any(res is True for res in results):
+                FreeCAD.getDocument(doc_name).recompute()
+            return results
+
+        return [
+            {"success": True, "object_name": obj_name} if res is True else {"success": False, "error": res}
+            for obj_name, res in zip(obj_names, run_in_gui(task))
+        ]
+
     def execute_code(self, code: str) -> dict[str, Any]:
+        # Compile on this RPC thread so the GUI task only has to run the code
+        try:
+            code_obj = _compile_code(code)
+        except (SyntaxError, ValueError) as e:
+            FreeCAD.Console.PrintError(f"Error executing Python code: {e}\n")
+            return {"success": False, "error": f"Error executing Python code: {e}\n"}
+
         output_buffer = io.StringIO()
         def task():
             try:
                 with contextlib.redirect_stdout(output_buffer):
-                    exec(code, globals())
-                FreeCAD.Console.PrintMessage("Python code executed successfully.\n")
+                    exec(code_obj, globals())
+                _log("Python code executed successfully.\n")
                 return True
             except Exception as e:
                 FreeCAD.Console.PrintError(
@@ -183,33 +560,41 @@ class FreeCADRPC:
                 )
                 return f"Error executing Python code: {e}\n"
 
-        rpc_request_queue.put(task)
-        res = rpc_response_queue.get()
+        res = run_in_gui(task)
         if res is True:
-            return {
+            # Return at most MAX_EXEC_OUTPUT characters of captured stdout
+            overflow = output_buffer.tell() > MAX_EXEC_OUTPUT
+            if overflow:
+                output_buffer.seek(0)
+                output = output_buffer.read(MAX_EXEC_OUTPUT) + "\n[output truncated]"
+            else:
+                output = output_buffer.getvalue()
+            result = {
                 "success": True,
-                "message": "Python code execution scheduled. \nOutput: " + output_buffer.getvalue()
+                "message": f"Python code execution scheduled. \nOutput: {output}",
             }
+            if overflow:
+                result["overflow"] = True
+            return result
         else:
             return {"success": False, "error": res}
 
     def get_objects(self, doc_name):
-        doc = FreeCAD.getDocument(doc_name)
-        if doc:
-            return [serialize_object(obj) for obj in doc.Objects]
-        else:
-            return []
+        return run_in_gui(lambda: self._get_objects_gui(doc_name))
 
     def get_object(self, doc_name, obj_name):
-        doc = FreeCAD.getDocument(doc_name)
-        if doc:
-            return serialize_object(doc.getObject(obj_name))
-        else:
-            return None
+        return run_in_gui(lambda: self._get_object_gui(doc_name, obj_name))
+
+    def get_objects_bulk(self, doc_name: str, obj_names: list[str]) -> dict[str, Any]:
+        """Serialize several objects of a document in one GUI task.
+
+        Returns a dict mapping each requested name to its serialized object,
+        or to None if the document has no object of that name.
+        """
+        return run_in_gui(lambda: self._get_objects_bulk_gui(doc_name, obj_names))
 
     def insert_part_from_library(self, relative_path):
-        rpc_request_queue.put(lambda: self._insert_part_from_library(relative_path))
-        res = rpc_response_queue.get()
+        res = run_in_gui(lambda: self._insert_part_from_library(relative_path))
         if res is True:
             return {"success": True, "message": "Part inserted from library."}
         else:
@@ -235,42 +620,47 @@ class FreeCADRPC:
                     FreeCAD.Console.PrintWarning("No active view available\n")
                     return False
                 
-                view_type = type(active_view).__name__
-                has_save_image = hasattr(active_view, 'saveImage')
-                FreeCAD.Console.PrintMessage(f"View type: {view_type}, Has saveImage: {has_save_image}\n")
-                return has_save_image
+                view_class = type(active_view)
+                supported = _VIEW_SCREENSHOT_SUPPORT.get(view_class)
+                if supported is None:
+                    supported = (
+                        view_class.__name__ not in _UNSUPPORTED_VIEW_TYPES
+                        and hasattr(active_view, 'saveImage')
+                    )
+                    _VIEW_SCREENSHOT_SUPPORT[view_class] = supported
+                    _log(f"View type: {view_class.__name__}, supports screenshots: {supported}\n")
+                return supported
             except Exception as e:
                 FreeCAD.Console.PrintError(f"Error checking view capabilities: {e}\n")
                 return False
                 
-        rpc_request_queue.put(check_view_supports_screenshots)
-        supports_screenshots = rpc_response_queue.get()
-        
-        if not supports_screenshots:
-            FreeCAD.Console.PrintWarning("Current view does not support screenshots\n")
-            return None
-            
-        # If view supports screenshots, proceed with capture
-        fd, tmp_path = tempfile.mkstemp(suffix=".png")
+        fd, tmp_path = tempfile.mkstemp(suffix=_SCREENSHOT_SUFFIX, dir=_SCREENSHOT_TMP_DIR)
         os.close(fd)
-        rpc_request_queue.put(
-            lambda: self._save_active_screenshot(tmp_path, view_name)
-        )
-        res = rpc_response_queue.get()
-        if res is True:
-            try:
-                with open(tmp_path, "rb") as image_file:
-                    image_bytes = image_file.read()
-                    encoded = base64.b64encode(image_bytes).decode("utf-8")
-            finally:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-            return encoded
-        else:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-            FreeCAD.Console.PrintWarning(f"Failed to capture screenshot: {res}\n")
-            return None
+
+        # Check and capture in a single GUI task; reading and encoding the
+        # image below then happens on this RPC thread, not the GUI thread
+        def capture():
+            if not check_view_supports_screenshots():
+                return None
+            return self._save_active_screenshot(tmp_path, view_name)
+
+        try:
+            res = run_in_gui(capture)
+            if res is None:
+                FreeCAD.Console.PrintWarning("Current view does not support screenshots\n")
+                return None
+            if res is not True:
+                FreeCAD.Console.PrintWarning(f"Failed to capture screenshot: {res}\n")
+                return None
+            encoded = _read_screenshot(tmp_path)
+            if encoded is None:
+                FreeCAD.Console.PrintWarning("Failed to encode screenshot\n")
+                return None
+            return base64.b64encode(encoded).decode("ascii")
+        finally:
+            # saveImage() may have failed before the file was replaced
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
 
     def get_nodes_workbench_screenshot(self) -> str:
         """Get a screenshot of the Nodes workbench interface.
@@ -279,13 +669,25 @@ class FreeCADRPC:
         workbench is not active or no node editor window is available.
         """
         def check_nodes_workbench_available():
+            global _nodes_widget_ref
             try:
-                from PySide import QtWidgets, QtGui
-                
+                from PySide import QtWidgets
+
+                # Reuse the widget found last time while it is still shown
+                cached = _nodes_widget_ref() if _nodes_widget_ref else None
+                if cached is not None:
+                    try:
+                        if cached.isVisible():
+                            return cached
+                    except RuntimeError:
+                        # The underlying Qt widget has been deleted
+                        pass
+                    _nodes_widget_ref = None
+
                 # Check if the Nodes workbench is loaded
                 wb = FreeCADGui.activeWorkbench()
                 if wb and hasattr(wb, 'MenuText') and 'Nodes' in wb.MenuText:
-                    FreeCAD.Console.PrintMessage("Nodes workbench is active\n")
+                    _log("Nodes workbench is active\n")
                 else:
                     # Try to find nodes workbench even if not currently active
                     workbenches = FreeCADGui.listWorkbenches()
@@ -293,232 +695,295 @@ class FreeCADRPC:
                     if not nodes_available:
                         FreeCAD.Console.PrintWarning("Nodes workbench is not available\n")
                         return False
-                
+
                 # Look for the node editor widget in the application
                 app = QtWidgets.QApplication.instance()
                 if not app:
                     FreeCAD.Console.PrintWarning("No QApplication instance found\n")
                     return False
-                
+
                 # Search for node editor windows/widgets
+                found = None
                 for widget in app.allWidgets():
+                    # Every match below must be visible, so skip hidden widgets early
+                    if not widget.isVisible():
+                        continue
                     widget_class = widget.__class__.__name__
-                    widget_module = widget.__class__.__module__ if hasattr(widget.__class__, '__module__') else ''
-                    
+                    widget_module = getattr(widget.__class__, '__module__', '') or ''
+
                     # Look for FCN (FreeCAD Nodes) widgets specifically
-                    if widget_class.startswith('FCN') and widget.isVisible():
-                        FreeCAD.Console.PrintMessage(f"Found FCN widget: {widget_class} from {widget_module}\n")
-                        return widget
-                    
+                    if widget_class.startswith('FCN'):
+                        _log(f"Found FCN widget: {widget_class} from {widget_module}\n")
+                        found = widget
+                        break
+
                     # Look for other node editor related widgets
-                    if any(keyword in widget_class.lower() for keyword in ['node', 'graph', 'scene']):
-                        if widget.isVisible() and any(keyword in widget_module.lower() for keyword in ['node', 'graph']):
-                            FreeCAD.Console.PrintMessage(f"Found potential node editor widget: {widget_class} from {widget_module}\n")
-                            return widget
-                    
+                    class_lower = widget_class.lower()
+                    if any(keyword in class_lower for keyword in _NODE_CLASS_KEYWORDS):
+                        module_lower = widget_module.lower()
+                        if any(keyword in module_lower for keyword in _NODE_MODULE_KEYWORDS):
+                            _log(f"Found potential node editor widget: {widget_class} from {widget_module}\n")
+                            found = widget
+                            break
+
                     # Also check for main windows with node-related titles
-                    if hasattr(widget, 'windowTitle') and widget.windowTitle():
-                        title = widget.windowTitle().lower()
-                        if any(keyword in title for keyword in ['node', 'nodes', 'graph', 'visual', 'scripting']) and widget.isVisible():
-                            FreeCAD.Console.PrintMessage(f"Found node editor window: {widget.windowTitle()}\n")
-                            return widget
-                
-                FreeCAD.Console.PrintWarning("No active node editor interface found\n")
-                return False
-                
+                    window_title = widget.windowTitle() if hasattr(widget, 'windowTitle') else ''
+                    if window_title:
+                        title = window_title.lower()
+                        if any(keyword in title for keyword in _NODE_TITLE_KEYWORDS):
+                            _log(f"Found node editor window: {window_title}\n")
+                            found = widget
+                            break
+
+                if found is None:
+                    FreeCAD.Console.PrintWarning("No active node editor interface found\n")
+                    return False
+
+                _nodes_widget_ref = weakref.ref(found)
+                return found
+
             except Exception as e:
                 FreeCAD.Console.PrintError(f"Error checking Nodes workbench: {e}\n")
                 return False
-        
-        rpc_request_queue.put(check_nodes_workbench_available)
-        nodes_widget = rpc_response_queue.get()
-        
-        if not nodes_widget:
+
+        # Find the widget and grab it in a single GUI task; the image is
+        # PNG- and base64-encoded on this RPC thread
+        def capture():
+            nodes_widget = check_nodes_workbench_available()
+            if not nodes_widget:
+                return None
+            return self._save_nodes_workbench_screenshot(nodes_widget)
+
+        res = run_in_gui(capture)
+        if res is None:
             FreeCAD.Console.PrintWarning("Nodes workbench interface not available\n")
             return None
-        
-        # Create screenshots directory if it doesn't exist
-        screenshots_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'screenshots', 'nodes')
-        os.makedirs(screenshots_dir, exist_ok=True)
-        
-        # Create temporary file for screenshot
-        fd, tmp_path = tempfile.mkstemp(suffix=".png", dir=screenshots_dir)
-        os.close(fd)
-        
-        rpc_request_queue.put(
-            lambda: self._save_nodes_workbench_screenshot(tmp_path, nodes_widget)
-        )
-        res = rpc_response_queue.get()
-        
-        if res is True:
-            try:
-                with open(tmp_path, "rb") as image_file:
-                    image_bytes = image_file.read()
-                    encoded = base64.b64encode(image_bytes).decode("utf-8")
-            finally:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-            return encoded
-        else:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        if isinstance(res, str):
             FreeCAD.Console.PrintWarning(f"Failed to capture nodes workbench screenshot: {res}\n")
             return None
+        if _SCREENSHOT_MAX_DIM > 0 and max(res.width(), res.height()) > _SCREENSHOT_MAX_DIM:
+            res = res.scaled(
+                _SCREENSHOT_MAX_DIM, _SCREENSHOT_MAX_DIM,
+                QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation,
+            )
+        encoded = _encode_image(res, "PNG", _NODES_SCREENSHOT_PNG_QUALITY)
+        if encoded is None:
+            FreeCAD.Console.PrintWarning("Failed to encode nodes workbench screenshot as PNG\n")
+            return None
+        return base64.b64encode(encoded).decode("ascii")
 
     def nodes_create_node(self, node_type_op_code: str, title: str | None, x_pos: float, y_pos: float):
-        rpc_request_queue.put(lambda: self._nodes_create_node_gui(node_type_op_code, title, x_pos, y_pos))
-        res = rpc_response_queue.get()
-        return res
+        spec = {"node_type_op_code": node_type_op_code, "title": title, "x_pos": x_pos, "y_pos": y_pos}
+        return run_in_gui(lambda: self._nodes_create_nodes_gui([spec]))[0]
+
+    def nodes_create_nodes(self, specs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several nodes in one GUI task.
+
+        Each spec takes the same keys as the ``nodes_create_node`` arguments.
+        Returns one result dict per spec, in order.
+        """
+        return run_in_gui(lambda: self._nodes_create_nodes_gui(specs))
 
-    def _nodes_create_node_gui(self, node_type_op_code: str, title: str | None, x_pos: float, y_pos: float):
-        FreeCAD.Console.PrintMessage(f"Attempting to create node: {node_type_op_code} at ({x_pos}, {y_pos}) with title '{title}'\n")
+    def _nodes_create_nodes_gui(self, specs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        _log(f"Attempting to create {len(specs)} node(s)\n")
         try:
-            # Check if Nodes workbench is active
-            current_wb = FreeCADGui.activeWorkbench()
-            if not hasattr(current_wb, "MenuText") or "Nodes" not in current_wb.MenuText:
-                # Attempt to activate Nodes workbench if available
+            try:
+                doc, nodes_store, scene = self._nodes_get_scene_gui()
+            except _NodesUnavailableError as e:
+                return [_node_failure(str(e)) for _ in specs]
+
+            results = []
+            created = []
+            for spec in specs:
+                # Failures are reported per entry so nodes already created in
+                # this batch still get their history entry and recompute below
+                if not isinstance(spec, dict) or "node_type_op_code" not in spec:
+                    results.append(_node_failure("Each node spec must be a dict with a 'node_type_op_code' key."))
+                    continue
+                try:
+                    res, node = self._nodes_create_node_gui(
+                        nodes_store,
+                        scene,
+                        spec["node_type_op_code"],
+                        spec.get("title"),
+                        spec.get("x_pos", 0.0),
+                        spec.get("y_pos", 0.0),
+                    )
+                except Exception as e:
+                    FreeCAD.Console.PrintError(f"Error creating node: {e}\n")
+                    res, node = _node_failure(f"Error creating node: {str(e)}"), None
+                results.append(res)
+                if node is not None:
+                    created.append(node)
+
+            if created:
+                # Store history for undo/redo
+                if hasattr(scene, 'history'):
+                    if len(created) == 1:
+                        description = f"Created node {created[0].__class__.__name__} via MCP"
+                    else:
+                        description = f"Created {len(created)} nodes via MCP"
+                    scene.history.storeHistory(description, setModified=True)
+                doc.recompute()  # Update the document state once for the whole batch
+
+            return results
+
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"Error creating node: {e}\n")
+            import traceback
+            FreeCAD.Console.PrintError(traceback.format_exc())
+            return [_node_failure(f"Error creating node: {str(e)}") for _ in specs]
+
+    def _nodes_get_scene_gui(self):
+        """Activate the Nodes workbench and return ``(doc, NodesStore, scene)``.
+
+        Raises ``_NodesUnavailableError`` with a user-facing message when any
+        part of the Nodes editor cannot be reached.
+        """
+        global _nodes_workbench_key
+
+        # Check if Nodes workbench is active
+        current_wb = FreeCADGui.activeWorkbench()
+        if not hasattr(current_wb, "MenuText") or "Nodes" not in current_wb.MenuText:
+            # Attempt to activate Nodes workbench if available
+            if _nodes_workbench_key is None:
                 workbenches = FreeCADGui.listWorkbenches()
-                nodes_wb_key = next((key for key, wb in workbenches.items() if "Nodes" in wb.MenuText), None)
-                if nodes_wb_key:
-                    FreeCADGui.activateWorkbench(nodes_wb_key)
-                    FreeCAD.Console.PrintMessage("Activated Nodes workbench.\n")
-                else:
-                    return {"success": False, "node_id": None, "title": None, "message": "Nodes workbench is not available."}
+                _nodes_workbench_key = next((key for key, wb in workbenches.items() if "Nodes" in wb.MenuText), None)
+            nodes_wb_key = _nodes_workbench_key
+            if nodes_wb_key:
+                FreeCADGui.activateWorkbench(nodes_wb_key)
+                _log("Activated Nodes workbench.\n")
+            else:
+                raise _NodesUnavailableError("Nodes workbench is not available.")
 
-            # Get active document
-            doc = FreeCAD.ActiveDocument
-            if not doc:
-                return {"success": False, "node_id": None, "title": None, "message": "No active document."}
+        # Get active document
+        doc = FreeCAD.ActiveDocument
+        if not doc:
+            raise _NodesUnavailableError("No active document.")
 
-            # Import required modules
-            try:
-                import nodes_locator
-                from core.nodes_conf import NodesStore
-            except ImportError as e:
-                return {"success": False, "node_id": None, "title": None, "message": f"Cannot import nodes modules: {e}"}
+        # Import required modules
+        try:
+            import nodes_locator
+            from core.nodes_conf import NodesStore
+        except ImportError as e:
+            raise _NodesUnavailableError(f"Cannot import nodes modules: {e}")
 
-            # Get the nodes workbench and window
-            try:
-                nodes_wb = nodes_locator.get_nodes_workbench()
-                if not nodes_wb:
-                    return {"success": False, "node_id": None, "title": None, "message": "Nodes workbench not available."}
-                
-                nodes_window = nodes_wb.window
-                if not nodes_window:
-                    return {"success": False, "node_id": None, "title": None, "message": "Nodes window not available."}
-                
-                # Make sure the nodes window is shown
-                if hasattr(nodes_window, 'show'):
-                    nodes_window.show()
-                
-            except Exception as e:
-                return {"success": False, "node_id": None, "title": None, "message": f"Error accessing Nodes workbench: {e}"}
+        # Get the nodes workbench and window
+        try:
+            nodes_wb = nodes_locator.get_nodes_workbench()
+            if not nodes_wb:
+                raise _NodesUnavailableError("Nodes workbench not available.")
+
+            nodes_window = nodes_wb.window
+            if not nodes_window:
+                raise _NodesUnavailableError("Nodes window not available.")
+
+            # Make sure the nodes window is shown
+            if hasattr(nodes_window, 'show'):
+                nodes_window.show()
+
+        except _NodesUnavailableError:
+            raise
+        except Exception as e:
+            raise _NodesUnavailableError(f"Error accessing Nodes workbench: {e}")
+
+        # Get the current editor (or create one if needed)
+        current_editor = nodes_window.getCurrentNodeEditorWidget()
+        if not current_editor:
+            # Try to create a new file/editor
+            if hasattr(nodes_window, 'onFileNew'):
+                nodes_window.onFileNew()
+                current_editor = nodes_window.getCurrentNodeEditorWidget()
 
-            # Refresh nodes list to ensure all nodes are loaded
-            NodesStore.refresh_nodes_list()
-            
-            # Get the current editor (or create one if needed)
-            current_editor = nodes_window.getCurrentNodeEditorWidget()
             if not current_editor:
-                # Try to create a new file/editor
-                if hasattr(nodes_window, 'onFileNew'):
-                    nodes_window.onFileNew()
-                    current_editor = nodes_window.getCurrentNodeEditorWidget()
-                
-                if not current_editor:
-                    return {"success": False, "node_id": None, "title": None, "message": "Could not create or access node editor."}
-            
-            # Get the scene
-            if not hasattr(current_editor, 'scene'):
-                return {"success": False, "node_id": None, "title": None, "message": "Node editor has no scene."}
-            
-            scene = current_editor.scene
-            if not scene:
-                return {"success": False, "node_id": None, "title": None, "message": "Scene is not available."}
+                raise _NodesUnavailableError("Could not create or access node editor.")
 
-            # Find the node class by op_code or by matching the node_type_op_code string
-            node_class = None
-            
-            # First try direct lookup if it's already an op_code
-            if node_type_op_code in NodesStore.nodes:
-                node_class = NodesStore.nodes[node_type_op_code]
-            else:
-                # Try to find by matching the string representation
-                for op_code, cls in NodesStore.nodes.items():
-                    if str(cls) == node_type_op_code or op_code == node_type_op_code:
-                        node_class = cls
-                        break
-                
-                # If still not found, try to find by class name or op_title
-                if not node_class:
-                    # Extract class name from node_type_op_code like "<class 'number_number.Number'>"
-                    if node_type_op_code.startswith("<class '") and node_type_op_code.endswith("'>"):
-                        class_path = node_type_op_code[8:-2]  # Remove "<class '" and "'>"
-                        class_name = class_path.split('.')[-1]  # Get the last part
-                        
-                        for op_code, cls in NodesStore.nodes.items():
-                            if (hasattr(cls, '__name__') and cls.__name__ == class_name) or \
-                               (hasattr(cls, 'op_title') and cls.op_title == class_name):
-                                node_class = cls
-                                break
-            
-            if not node_class:
-                available_nodes = [f"{getattr(cls, 'op_title', cls.__name__)}" for cls in NodesStore.nodes.values()]
-                return {"success": False, "node_id": None, "title": None, 
-                       "message": f"Node type '{node_type_op_code}' not found. Available: {available_nodes[:10]}"}
+        # Get the scene
+        if not hasattr(current_editor, 'scene'):
+            raise _NodesUnavailableError("Node editor has no scene.")
 
-            # Create the node
-            try:
-                node = node_class(scene)
-                FreeCAD.Console.PrintMessage(f"Created node: {node}\n")
-                
-                # Set position
-                node.setPos(x_pos, y_pos)
-                
-                # Try to set title if provided and supported
-                if title and hasattr(node, 'title') and hasattr(node.title, 'setText'):
-                    node.title.setText(title)
-                
-                # Get node properties for return
-                node_id = getattr(node, 'id', None)
-                # Convert node_id to string to avoid XML-RPC integer overflow
-                if node_id is not None:
-                    node_id = str(node_id)
-                    
-                node_title = None
-                
-                if hasattr(node, 'title') and hasattr(node.title, 'text'):
-                    node_title = node.title.text()
-                elif hasattr(node, 'op_title'):
-                    node_title = node.op_title
-                elif title:
-                    node_title = title
-                
-                # Store history for undo/redo
-                if hasattr(scene, 'history'):
-                    scene.history.storeHistory(f"Created node {node.__class__.__name__} via MCP", setModified=True)
-                
-                FreeCAD.Console.PrintMessage(f"Node created successfully: ID='{node_id}', Title='{node_title}'\n")
-                doc.recompute()  # Update the document state
-                
-                return {"success": True, "node_id": node_id, "title": node_title, "message": "Node created successfully."}
-                
-            except Exception as e:
-                return {"success": False, "node_id": None, "title": None, "message": f"Error creating node instance: {str(e)}"}
+        scene = current_editor.scene
+        if not scene:
+            raise _NodesUnavailableError("Scene is not available.")
+
+        return doc, NodesStore, scene
+
+    def _nodes_create_node_gui(self, nodes_store, scene, node_type_op_code: str, title: str | None, x_pos: float, y_pos: float):
+        """Create one node in ``scene``.
+
+        Returns ``(result_dict, node)``; ``node`` is None when creation failed.
+        """
+        _log(f"Attempting to create node: {node_type_op_code} at ({x_pos}, {y_pos}) with title '{title}'\n")
+
+        node_class = _find_node_class(nodes_store, node_type_op_code)
+
+        if not node_class:
+            available_nodes = [f"{getattr(cls, 'op_title', cls.__name__)}" for cls in nodes_store.nodes.values()]
+            return _node_failure(f"Node type '{node_type_op_code}' not found. Available: {available_nodes[:10]}"), None
+
+        # Create the node
+        try:
+            node = node_class(scene)
+            _log(f"Created node: {node}\n")
+
+            # Set position
+            node.setPos(x_pos, y_pos)
+
+            # Try to set title if provided and supported
+            if title and hasattr(node, 'title') and hasattr(node.title, 'setText'):
+                node.title.setText(title)
+
+            # Get node properties for return
+            node_id = getattr(node, 'id', None)
+            # Convert node_id to string to avoid XML-RPC integer overflow
+            if node_id is not None:
+                node_id = str(node_id)
+
+            node_title = None
+
+            if hasattr(node, 'title') and hasattr(node.title, 'text'):
+                node_title = node.title.text()
+            elif hasattr(node, 'op_title'):
+                node_title = node.op_title
+            elif title:
+                node_title = title
+
+            _log(f"Node created successfully: ID='{node_id}', Title='{node_title}'\n")
+
+            return {"success": True, "node_id": node_id, "title": node_title, "message": "Node created successfully."}, node
 
         except Exception as e:
-            FreeCAD.Console.PrintError(f"Error creating node: {e}\n")
-            import traceback
-            FreeCAD.Console.PrintError(traceback.format_exc())
-            return {"success": False, "node_id": None, "title": None, "message": f"Error creating node: {str(e)}"}
+            return _node_failure(f"Error creating node instance: {str(e)}"), None
+
+    def _get_objects_gui(self, doc_name):
+        doc = FreeCAD.getDocument(doc_name)
+        if doc:
+            return [serialize_object(obj) for obj in doc.Objects]
+        else:
+            return []
+
+    def _get_object_gui(self, doc_name, obj_name):
+        doc = FreeCAD.getDocument(doc_name)
+        if doc:
+            return serialize_object(doc.getObject(obj_name))
+        else:
+            return None
+
+    def _get_objects_bulk_gui(self, doc_name, obj_names):
+        doc = FreeCAD.getDocument(doc_name)
+        result = {}
+        for name in obj_names:
+            obj = doc.getObject(name) if doc else None
+            result[name] = serialize_object(obj) if obj else None
+        return result
 
     def _create_document_gui(self, name):
         doc = FreeCAD.newDocument(name)
         doc.recompute()
-        FreeCAD.Console.PrintMessage(f"Document '{name}' created via RPC.\n")
+        _log(f"Document '{name}' created via RPC.\n")
         return True
 
-    def _create_object_gui(self, doc_name, obj: Object):
+    def _create_object_gui(self, doc_name, obj: Object, recompute: bool = True):
         doc = FreeCAD.getDocument(doc_name)
         if doc:
             try:
@@ -538,11 +1003,14 @@ class FreeCADRPC:
                     for param, value in obj.properties.items():
                         if hasattr(res, param):
                             setattr(res, param, value)
+                    # Meshing reads the Part shape and the mesh parameters right
+                    # away, so they and anything pending from a deferred batch
+                    # must be recomputed first
                     doc.recompute()
 
                     gmsh_tools = GmshTools(res)
                     gmsh_tools.create_mesh()
-                    FreeCAD.Console.PrintMessage(
+                    _log(
                         f"FEM Mesh '{res.Name}' generated successfully in '{doc_name}'.\n"
                     )
                 elif obj.type.startswith("Fem::"):
@@ -557,7 +1025,7 @@ class FreeCADRPC:
                     if callable(make_method):
                         res = make_method(doc, obj.name)
                         set_object_property(doc, res, obj.properties)
-                        FreeCAD.Console.PrintMessage(
+                        _log(
                             f"FEM object '{res.Name}' created with '{method_name}'.\n"
                         )
                     else:
@@ -567,11 +1035,12 @@ class FreeCADRPC:
                 else:
                     res = doc.addObject(obj.type, obj.name)
                     set_object_property(doc, res, obj.properties)
-                    FreeCAD.Console.PrintMessage(
+                    _log(
                         f"{res.TypeId} '{res.Name}' added to '{doc_name}' via RPC.\n"
                     )
- 
-                doc.recompute()
+
+                if recompute:
+                    doc.recompute()
                 return True
             except Exception as e:
                 return str(e)
@@ -579,7 +1048,7 @@ class FreeCADRPC:
             FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
             return f"Document '{doc_name}' not found.\n"
 
-    def _edit_object_gui(self, doc_name: str, obj: Object):
+    def _edit_object_gui(self, doc_name: str, obj: Object, recompute: bool = True):
         doc = FreeCAD.getDocument(doc_name)
         if not doc:
             FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
@@ -593,27 +1062,21 @@ class FreeCADRPC:
         try:
             # For Fem::ConstraintFixed
             if hasattr(obj_ins, "References") and "References" in obj.properties:
-                refs = []
-                for ref_name, face in obj.properties["References"]:
-                    ref_obj = doc.getObject(ref_name)
-                    if ref_obj:
-                        refs.append((ref_obj, face))
-                    else:
-                        raise ValueError(f"Referenced object '{ref_name}' not found.")
-                obj_ins.References = refs
-                FreeCAD.Console.PrintMessage(
+                obj_ins.References = resolve_references(doc, obj.properties["References"])
+                _log(
                     f"References updated for '{obj.name}' in '{doc_name}'.\n"
                 )
                 # delete References from properties
                 del obj.properties["References"]
             set_object_property(doc, obj_ins, obj.properties)
-            doc.recompute()
-            FreeCAD.Console.PrintMessage(f"Object '{obj.name}' updated via RPC.\n")
+            if recompute:
+                doc.recompute()
+            _log(f"Object '{obj.name}' updated via RPC.\n")
             return True
         except Exception as e:
             return str(e)
 
-    def _delete_object_gui(self, doc_name: str, obj_name: str):
+    def _delete_object_gui(self, doc_name: str, obj_name: str, recompute: bool = True):
         doc = FreeCAD.getDocument(doc_name)
         if not doc:
             FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
@@ -621,8 +1084,9 @@ class FreeCADRPC:
 
         try:
             doc.removeObject(obj_name)
-            doc.recompute()
-            FreeCAD.Console.PrintMessage(f"Object '{obj_name}' deleted via RPC.\n")
+            if recompute:
+                doc.recompute()
+            _log(f"Object '{obj_name}' deleted via RPC.\n")
             return True
         except Exception as e:
             return str(e)
@@ -641,36 +1105,19 @@ class FreeCADRPC:
             if not hasattr(view, 'saveImage'):
                 return "Current view does not support screenshots"
                 
-            if view_name == "Isometric":
-                view.viewIsometric()
-            elif view_name == "Front":
-                view.viewFront()
-            elif view_name == "Top":
-                view.viewTop()
-            elif view_name == "Right":
-                view.viewRight()
-            elif view_name == "Back":
-                view.viewBack()
-            elif view_name == "Left":
-                view.viewLeft()
-            elif view_name == "Bottom":
-                view.viewBottom()
-            elif view_name == "Dimetric":
-                view.viewDimetric()
-            elif view_name == "Trimetric":
-                view.viewTrimetric()
-            else:
+            method_name = _VIEW_METHODS.get(view_name)
+            if method_name is None:
                 raise ValueError(f"Invalid view name: {view_name}")
+            getattr(view, method_name)()
             view.fitAll()
             view.saveImage(save_path, 1)
             return True
         except Exception as e:
             return str(e)
 
-    def _save_nodes_workbench_screenshot(self, save_path: str, nodes_widget):
+    def _save_nodes_workbench_screenshot(self, nodes_widget):
+        """Grab the node editor widget and return it as a QImage, or an error string."""
         try:
-            from PySide import QtWidgets, QtGui
-            
             # Ensure the widget is valid and visible
             if not nodes_widget or not nodes_widget.isVisible():
                 return "Node editor widget is not visible or invalid"
@@ -680,28 +1127,225 @@ class FreeCADRPC:
             if pixmap.isNull():
                 return "Failed to capture widget content"
             
-            # Save the screenshot
-            success = pixmap.save(save_path, "PNG")
-            if not success:
-                return "Failed to save screenshot to file"
-            
-            FreeCAD.Console.PrintMessage(f"Nodes workbench screenshot saved to: {save_path}\n")
-            return True
+            # QPixmap is tied to the GUI thread, QImage is not; encoding the
+            # QImage is left to the caller's thread
+            return pixmap.toImage()
             
         except Exception as e:
             return str(e)
 
 
+# Maximum number of RPC requests handled at the same time; further requests
+# wait for a worker to become free
+RPC_MAX_WORKERS = 8
+
+# Maximum number of open client connections. Each pooled client connection
+# stays open between calls, so this is set well above RPC_MAX_WORKERS; the
+# MCP server keeps up to 4 per client.
+RPC_MAX_CONNECTIONS = 32
+
+
+# Path on the RPC port that accepts JSON-RPC 2.0 instead of XML-RPC
+JSONRPC_PATH = "/jsonrpc"
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Seconds an idle keep-alive connection is held open before it is closed
+RPC_KEEPALIVE_TIMEOUT = 30
+
+
+class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    """Request handler that keeps the HTTP connection open between calls.
+
+    SimpleXMLRPCRequestHandler speaks HTTP/1.0 and closes the socket after
+    every response, so each call paid for a new TCP connection.
+    """
+
+    protocol_version = "HTTP/1.1"
+    timeout = RPC_KEEPALIVE_TIMEOUT
+
+    def do_POST(self):
+        # Workers are counted per request, so an idle keep-alive connection
+        # does not hold a slot while it waits for its next call
+        self.server.acquire_worker()
+        try:
+            # A request already in flight when the server is stopped is
+            # still answered; ones that arrive or were queued are refused
+            if self.server.closing:
+                self._reply_unavailable()
+            elif self.path == JSONRPC_PATH:
+                self._handle_jsonrpc()
+            else:
+                super().do_POST()
+        finally:
+            self.server.release_worker()
+
+    def _reply_unavailable(self):
+        # The request body is left unread, so the connection cannot be reused
+        self.close_connection = True
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+    def log_error(self, format, *args):
+        # Idle pooled connections time out routinely; the default handler
+        # would print each one to stderr, which FreeCAD shows as an error
+        if format.startswith("Request timed out"):
+            return
+        super().log_error(format, *args)
+
+    def _handle_jsonrpc(self):
+        try:
+            length = int(self.headers.get("content-length", 0))
+            request = _json_loads(self.rfile.read(length))
+        except ValueError:
+            reply = {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+        else:
+            if isinstance(request, list):
+                reply = [self._jsonrpc_call(item) for item in request]
+            else:
+                reply = self._jsonrpc_call(request)
+
+        body = _json_dumps(reply)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _jsonrpc_call(self, request) -> dict[str, Any]:
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            params = request.get("params", [])
+            if not isinstance(params, list):
+                raise TypeError("params must be an array")
+            # Same dispatch as XML-RPC, including the system.* functions
+            result = self.server._dispatch(request["method"], params)
+        except Exception as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": 1, "message": f"{type(e)}:{e}"},
+            }
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class ThreadedRPCServer(socketserver.ThreadingMixIn, SimpleXMLRPCServer):
+    """XML-RPC server that handles each connection on its own thread.
+
+    At most ``RPC_MAX_WORKERS`` requests run concurrently; a request that
+    arrives while all of them are busy waits for one to finish. Separately,
+    at most ``RPC_MAX_CONNECTIONS`` connections are held open; further
+    connections are refused with ``503 Service Unavailable``.
+
+    Open connections are tracked so that ``close_connections()`` can end
+    them when the server is stopped; otherwise pooled clients would keep
+    calling into a stopped server.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self, *args, max_workers: int = RPC_MAX_WORKERS,
+        max_connections: int = RPC_MAX_CONNECTIONS, **kwargs
+    ):
+        kwargs.setdefault("requestHandler", KeepAliveRequestHandler)
+        super().__init__(*args, **kwargs)
+        self._worker_slots = threading.BoundedSemaphore(max_workers)
+        self._connection_slots = threading.BoundedSemaphore(max_connections)
+        self._connections: set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+        self._closing = threading.Event()
+
+    @property
+    def closing(self) -> bool:
+        return self._closing.is_set()
+
+    def close_connections(self) -> None:
+        """Refuse further requests and end every open connection."""
+        self._closing.set()
+        with self._connections_lock:
+            connections = list(self._connections)
+        for request in connections:
+            self._end_connection(request)
+
+    @staticmethod
+    def _end_connection(request) -> None:
+        # Shutting down only the read side wakes a handler waiting for the
+        # next request, while a reply that is being written still goes out
+        with contextlib.suppress(OSError):
+            request.shutdown(socket.SHUT_RD)
+
+    def acquire_worker(self) -> None:
+        """Block until fewer than ``max_workers`` requests are running."""
+        self._worker_slots.acquire()
+
+    def release_worker(self) -> None:
+        self._worker_slots.release()
+
+    def process_request(self, request, client_address):
+        if not self._connection_slots.acquire(blocking=False):
+            self._reject_busy(request)
+            return
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            self._connection_slots.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        with self._connections_lock:
+            self._connections.add(request)
+        # Accepted just before close_connections() took its snapshot
+        if self.closing:
+            self._end_connection(request)
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+            self._connection_slots.release()
+
+    def _reject_busy(self, request):
+        try:
+            request.sendall(
+                b"HTTP/1.0 503 Service Unavailable\r\n"
+                b"Content-Length: 0\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+
 def start_rpc_server(host="localhost", port=9875):
-    global rpc_server_thread, rpc_server_instance
+    global rpc_server_thread, rpc_server_instance, gui_dispatcher
 
     if rpc_server_instance:
         return "RPC Server already running."
 
-    rpc_server_instance = SimpleXMLRPCServer(
+    if gui_dispatcher is None:
+        gui_dispatcher = GuiDispatcher()
+
+    rpc_server_instance = ThreadedRPCServer(
         (host, port), allow_none=True, logRequests=False
     )
     rpc_server_instance.register_instance(FreeCADRPC())
+    # Lets clients batch an operation and its screenshot into one request
+    rpc_server_instance.register_multicall_functions()
 
     def server_loop():
         FreeCAD.Console.PrintMessage(f"RPC Server started at {host}:{port}\n")
@@ -710,7 +1354,8 @@ def start_rpc_server(host="localhost", port=9875):
     rpc_server_thread = threading.Thread(target=server_loop, daemon=True)
     rpc_server_thread.start()
 
-    QtCore.QTimer.singleShot(500, process_gui_tasks)
+    # Drain anything posted before the dispatcher was connected
+    QtCore.QTimer.singleShot(0, process_gui_tasks)
 
     return f"RPC Server started at {host}:{port}."
 
@@ -720,7 +1365,11 @@ def stop_rpc_server():
 
     if rpc_server_instance:
         rpc_server_instance.shutdown()
+        # shutdown() only stops accepting; keep-alive connections would
+        # otherwise go on serving calls from this stopped instance
+        rpc_server_instance.close_connections()
         rpc_server_thread.join()
+        rpc_server_instance.server_close()
         rpc_server_instance = None
         rpc_server_thread = None
         FreeCAD.Console.PrintMessage("RPC Server stopped.\n")
@@ -0,0 +1,111 @@
+import http.client
+import itertools
+import json
+import xmlrpc.client
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JSONRPC_PATH = "/jsonrpc"
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string for tool output.
+
+    The ``json`` fallback is configured to produce the same compact, UTF-8
+    text as orjson, so output does not depend on which one is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _Method:
+    def __init__(self, proxy: "JsonRpcServerProxy", name: str):
+        self._proxy = proxy
+        self._name = name
+
+    def __getattr__(self, name: str) -> "_Method":
+        return _Method(self._proxy, f"{self._name}.{name}")
+
+    def __call__(self, *params):
+        return self._proxy._request(self._name, list(params))
+
+
+class JsonRpcServerProxy:
+    """JSON-RPC 2.0 client with the calling convention of xmlrpc.client.ServerProxy.
+
+    Requests go to the addon's ``/jsonrpc`` endpoint over one keep-alive
+    HTTP connection. Errors are raised as ``xmlrpc.client.Fault`` so callers
+    and ``xmlrpc.client.MultiCall`` work unchanged.
+    """
+
+    def __init__(self, host: str, port: int):
+        self._host = host
+        self._port = port
+        self._connection: http.client.HTTPConnection | None = None
+        self._ids = itertools.count(1)
+
+    def __getattr__(self, name: str) -> _Method:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _Method(self, name)
+
+    def __call__(self, attr: str):
+        # Mirrors ServerProxy("close") so disconnect() works for both proxies
+        if attr == "close":
+            return self._close
+        raise AttributeError(f"Attribute {attr!r} not found")
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _request(self, method: str, params: list) -> Any:
+        body = dumps({"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params})
+        # Retry once if the server closed an idle keep-alive connection
+        for attempt in (0, 1):
+            if self._connection is None:
+                self._connection = http.client.HTTPConnection(self._host, self._port)
+            try:
+                self._connection.request(
+                    "POST", JSONRPC_PATH, body, {"Content-Type": "application/json"}
+                )
+                response = self._connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self._close()
+                if attempt:
+                    raise
+                continue
+            break
+
+        if response.will_close:
+            self._close()
+        if response.status != 200:
+            raise xmlrpc.client.ProtocolError(
+                f"{self._host}:{self._port}{JSONRPC_PATH}", response.status, response.reason, dict(response.headers)
+            )
+
+        reply = loads(data)
+        if "error" in reply:
+            error = reply["error"]
+            raise xmlrpc.client.Fault(error.get("code", -32000), error.get("message", ""))
+        return reply.get("result")
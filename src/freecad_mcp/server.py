@@ -1,12 +1,16 @@
-import json
+import asyncio
 import logging
+import queue
+import threading
 import xmlrpc.client
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Literal
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Any, Iterator, Literal
 
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.types import TextContent, ImageContent
 
+from .jsonrpc import JsonRpcServerProxy, dumps_str
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -15,11 +19,44 @@ logger = logging.getLogger("FreeCADMCPserver")
 
 
 _only_text_feedback = False
+# get_active_screenshot returns JPEG; the Nodes workbench screenshot stays PNG
+_VIEW_SCREENSHOT_MIME_TYPE = "image/jpeg"
+_use_json_rpc = False
+
+
+class FreeCADTransport(xmlrpc.client.Transport):
+    """XML-RPC transport tuned for the local FreeCAD addon.
+
+    Responses are not gzip-compressed: on a local socket compressing every
+    base64 screenshot costs far more than sending it. Uncompressed bodies
+    are handed to the parser in one piece instead of the stdlib's 1 KiB
+    reads.
+    """
+
+    accept_gzip_encoding = False
+
+    def parse_response(self, response):
+        if response.getheader("Content-Encoding", "") == "gzip":
+            return super().parse_response(response)
+        parser, unmarshaller = self.getparser()
+        parser.feed(response.read())
+        parser.close()
+        return unmarshaller.close()
 
 
 class FreeCADConnection:
     def __init__(self, host: str = "localhost", port: int = 9875):
-        self.server = xmlrpc.client.ServerProxy(f"http://{host}:{port}", allow_none=True)
+        if _use_json_rpc:
+            self.server = JsonRpcServerProxy(host, port)
+        else:
+            # Transport reuses its HTTP/1.1 connection for every call, so the
+            # tools do not open a new TCP connection per RPC
+            self.server = xmlrpc.client.ServerProxy(
+                f"http://{host}:{port}", allow_none=True, transport=FreeCADTransport()
+            )
+
+    def disconnect(self) -> None:
+        self.server("close")()
 
     def ping(self) -> bool:
         return self.server.ping()
@@ -30,12 +67,21 @@ class FreeCADConnection:
     def create_object(self, doc_name: str, obj_data: dict[str, Any]) -> dict[str, Any]:
         return self.server.create_object(doc_name, obj_data)
 
+    def create_objects(self, doc_name: str, objs_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return self.server.create_objects(doc_name, objs_data)
+
     def edit_object(self, doc_name: str, obj_name: str, obj_data: dict[str, Any]) -> dict[str, Any]:
         return self.server.edit_object(doc_name, obj_name, obj_data)
 
+    def edit_objects(self, doc_name: str, edits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return self.server.edit_objects(doc_name, edits)
+
     def delete_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
         return self.server.delete_object(doc_name, obj_name)
 
+    def delete_objects(self, doc_name: str, obj_names: list[str]) -> list[dict[str, Any]]:
+        return self.server.delete_objects(doc_name, obj_names)
+
     def insert_part_from_library(self, relative_path: str) -> dict[str, Any]:
         return self.server.insert_part_from_library(relative_path)
 
@@ -43,81 +89,98 @@ class FreeCADConnection:
         return self.server.execute_code(code)
 
     def get_active_screenshot(self, view_name: str = "Isometric") -> str | None:
+        # The addon checks whether the active view can be captured and
+        # returns None for views such as Spreadsheet or TechDraw
         try:
-            # Check if we're in a view that supports screenshots
-            result = self.server.execute_code("""
-import FreeCAD
-import FreeCADGui
-
-if FreeCAD.Gui.ActiveDocument and FreeCAD.Gui.ActiveDocument.ActiveView:
-    view_type = type(FreeCAD.Gui.ActiveDocument.ActiveView).__name__
-    
-    # These view types don't support screenshots
-    unsupported_views = ['SpreadsheetGui::SheetView', 'DrawingGui::DrawingView', 'TechDrawGui::MDIViewPage']
-    
-    if view_type in unsupported_views or not hasattr(FreeCAD.Gui.ActiveDocument.ActiveView, 'saveImage'):
-        print("Current view does not support screenshots")
-        False
-    else:
-        print(f"Current view supports screenshots: {view_type}")
-        True
-else:
-    print("No active view")
-    False
-""")
-
-            # If the view doesn't support screenshots, return None
-            if not result.get("success", False) or "Current view does not support screenshots" in result.get("message", ""):
+            screenshot = self.server.get_active_screenshot(view_name)
+            if screenshot is None:
                 logger.info("Screenshot unavailable in current view (likely Spreadsheet or TechDraw view)")
-                return None
-
-            # Otherwise, try to get the screenshot
-            return self.server.get_active_screenshot(view_name)
+            return screenshot
         except Exception as e:
             # Log the error but return None instead of raising an exception
-            logger.error(f"Error getting screenshot: {e}")
+            logger.error("Error getting screenshot: %s", e)
             return None
 
+    def call_with_screenshot(self, method_name: str, *args, view_name: str = "Isometric") -> tuple[Any, str | None]:
+        """Call an RPC method and capture the active view in one request.
+
+        Both calls are sent together through ``system.multicall``, so the
+        screenshot costs no extra round trip. The screenshot is skipped in
+        text-only mode. A failing screenshot is logged and returned as None;
+        a failing method call raises as usual.
+        """
+        return self._call_with(method_name, args, "get_active_screenshot", (view_name,))
+
+    def call_with_nodes_screenshot(self, method_name: str, *args) -> tuple[Any, str | None]:
+        """Like ``call_with_screenshot`` but captures the Nodes workbench."""
+        return self._call_with(method_name, args, "get_nodes_workbench_screenshot", ())
+
+    def _call_with(self, method_name: str, args: tuple, screenshot_method: str, screenshot_args: tuple) -> tuple[Any, str | None]:
+        if _only_text_feedback:
+            return getattr(self.server, method_name)(*args), None
+
+        multicall = xmlrpc.client.MultiCall(self.server)
+        getattr(multicall, method_name)(*args)
+        getattr(multicall, screenshot_method)(*screenshot_args)
+        results = multicall()
+        res = results[0]
+        try:
+            screenshot = results[1]
+        except xmlrpc.client.Fault as e:
+            logger.error("Error getting screenshot: %s", e)
+            screenshot = None
+        return res, screenshot
+
     def get_objects(self, doc_name: str) -> list[dict[str, Any]]:
         return self.server.get_objects(doc_name)
 
     def get_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
         return self.server.get_object(doc_name, obj_name)
 
+    def get_objects_bulk(self, doc_name: str, obj_names: list[str]) -> dict[str, dict[str, Any] | None]:
+        return self.server.get_objects_bulk(doc_name, obj_names)
+
     def get_parts_list(self) -> list[str]:
         return self.server.get_parts_list()
 
     def nodes_create_node(self, node_type_op_code: str, title: str | None, x_pos: float, y_pos: float) -> dict[str, Any]:
         return self.server.nodes_create_node(node_type_op_code, title, x_pos, y_pos)
 
+    def nodes_create_nodes(self, specs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return self.server.nodes_create_nodes(specs)
+
     def get_nodes_workbench_screenshot(self) -> str | None:
         try:
             return self.server.get_nodes_workbench_screenshot()
         except Exception as e:
-            logger.error(f"Error getting nodes workbench screenshot: {e}")
+            logger.error("Error getting nodes workbench screenshot: %s", e)
             return None
 
 
+async def _connect_on_startup() -> None:
+    try:
+        await run_rpc("ping")
+        logger.info("Successfully connected to FreeCAD on startup")
+    except Exception as e:
+        logger.warning("Could not connect to FreeCAD on startup: %s", e)
+        logger.warning(
+            "Make sure the FreeCAD addon is running before using FreeCAD resources or tools"
+        )
+
+
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    logger.info("FreeCADMCP server starting up")
+    # Connect in the background so a slow or busy FreeCAD does not hold up
+    # the MCP handshake; tools connect on demand if this has not finished
+    startup = asyncio.create_task(_connect_on_startup())
     try:
-        logger.info("FreeCADMCP server starting up")
-        try:
-            _ = get_freecad_connection()
-            logger.info("Successfully connected to FreeCAD on startup")
-        except Exception as e:
-            logger.warning(f"Could not connect to FreeCAD on startup: {str(e)}")
-            logger.warning(
-                "Make sure the FreeCAD addon is running before using FreeCAD resources or tools"
-            )
         yield {}
     finally:
-        # Clean up the global connection on shutdown
-        global _freecad_connection
-        if _freecad_connection:
-            logger.info("Disconnecting from FreeCAD on shutdown")
-            _freecad_connection.disconnect()
-            _freecad_connection = None
+        startup.cancel()
+        # Close every pooled connection on shutdown
+        if close_freecad_connections():
+            logger.info("Disconnected from FreeCAD on shutdown")
         logger.info("FreeCADMCP server shut down")
 
 
@@ -128,28 +191,136 @@ mcp = FastMCP(
 )
 
 
-_freecad_connection: FreeCADConnection | None = None
+# Maximum number of connections kept to FreeCAD. ServerProxy is not
+# thread-safe, so each in-flight tool call borrows its own connection.
+POOL_MAX = 4
 
+_pool: queue.LifoQueue[FreeCADConnection] = queue.LifoQueue()
+_pool_size = 0
+_pool_lock = threading.Lock()
 
-def get_freecad_connection():
-    """Get or create a persistent FreeCAD connection"""
-    global _freecad_connection
-    if _freecad_connection is None:
-        _freecad_connection = FreeCADConnection(host="localhost", port=9875)
-        if not _freecad_connection.ping():
-            logger.error("Failed to ping FreeCAD")
-            _freecad_connection = None
-            raise Exception(
-                "Failed to connect to FreeCAD. Make sure the FreeCAD addon is running."
-            )
-    return _freecad_connection
+
+def _connect_freecad() -> FreeCADConnection:
+    connection = FreeCADConnection(host="localhost", port=9875)
+    if not connection.ping():
+        logger.error("Failed to ping FreeCAD")
+        raise Exception(
+            "Failed to connect to FreeCAD. Make sure the FreeCAD addon is running."
+        )
+    return connection
+
+
+def _checkout_freecad() -> FreeCADConnection:
+    global _pool_size
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        pass
+
+    with _pool_lock:
+        grow = _pool_size < POOL_MAX
+        if grow:
+            _pool_size += 1
+    if not grow:
+        # Every connection is busy; wait for one to be returned
+        return _pool.get()
+
+    try:
+        return _connect_freecad()
+    except BaseException:
+        with _pool_lock:
+            _pool_size -= 1
+        raise
+
+
+@contextmanager
+def acquire_freecad() -> Iterator[FreeCADConnection]:
+    """Borrow a FreeCAD connection from the pool, connecting lazily."""
+    connection = _checkout_freecad()
+    try:
+        yield connection
+    finally:
+        _pool.put(connection)
+
+
+def close_freecad_connections() -> int:
+    """Disconnect and drop every idle pooled connection; returns how many."""
+    global _pool_size
+    closed = 0
+    while True:
+        try:
+            connection = _pool.get_nowait()
+        except queue.Empty:
+            return closed
+        connection.disconnect()
+        closed += 1
+        with _pool_lock:
+            _pool_size -= 1
+
+
+# Retries when FreeCAD refuses the connection, e.g. while it restarts.
+# Only refused connections are retried: the request never reached FreeCAD,
+# so repeating a mutating call cannot apply it twice.
+RPC_RETRY_ATTEMPTS = 3
+RPC_RETRY_DELAY = 0.25
+RPC_RETRY_BACKOFF = 2.0
+
+
+async def run_rpc(method_name: str, *args):
+    """Call a FreeCADConnection method on a worker thread.
+
+    Keeps the MCP event loop responsive while FreeCAD is busy. The call
+    runs on a connection borrowed from the pool.
+    """
+    def call():
+        with acquire_freecad() as freecad:
+            return getattr(freecad, method_name)(*args)
+
+    for attempt in range(RPC_RETRY_ATTEMPTS):
+        try:
+            return await asyncio.to_thread(call)
+        except ConnectionRefusedError:
+            if attempt == RPC_RETRY_ATTEMPTS - 1:
+                raise
+            logger.warning("FreeCAD refused the connection, retrying %s", method_name)
+            await asyncio.sleep(RPC_RETRY_DELAY * RPC_RETRY_BACKOFF ** attempt)
+
+
+async def fetch_screenshot(method_name: str = "get_active_screenshot", *args) -> str | None:
+    """Fetch a screenshot, or skip the RPC entirely in text-only mode."""
+    if _only_text_feedback:
+        return None
+    return await run_rpc(method_name, *args)
+
+
+async def run_tool_with_screenshot(
+    method_name: str, args: tuple, action: str, success_text: Callable[[dict[str, Any]], str]
+) -> list[TextContent | ImageContent]:
+    """Run a FreeCAD operation and build the usual tool response.
+
+    The operation and the screenshot travel in one request. A successful
+    result is described by ``success_text(res)``; failures and exceptions
+    are reported as ``"Failed to <action>: ..."``.
+    """
+    try:
+        res, screenshot = await run_rpc("call_with_screenshot", method_name, *args)
+        if res["success"]:
+            response = [TextContent(type="text", text=success_text(res))]
+        else:
+            response = [TextContent(type="text", text=f"Failed to {action}: {res['error']}")]
+        return add_screenshot_if_available(response, screenshot)
+    except Exception as e:
+        logger.exception("Failed to %s: %s", action, e)
+        return [
+            TextContent(type="text", text=f"Failed to {action}: {str(e)}")
+        ]
 
 
 # Helper function to safely add screenshot to response
 def add_screenshot_if_available(response, screenshot):
     """Safely add screenshot to response only if it's available"""
     if screenshot is not None and not _only_text_feedback:
-        response.append(ImageContent(type="image", data=screenshot, mimeType="image/png"))
+        response.append(ImageContent(type="image", data=screenshot, mimeType=_VIEW_SCREENSHOT_MIME_TYPE))
     elif not _only_text_feedback:
         # Add an informative message that will be seen by the AI model and user
         response.append(TextContent(
@@ -175,7 +346,7 @@ def add_nodes_screenshot_if_available(response: list[TextContent | ImageContent]
 
 
 @mcp.tool()
-def create_document(ctx: Context, name: str) -> list[TextContent]:
+async def create_document(ctx: Context, name: str) -> list[TextContent]:
     """Create a new document in FreeCAD.
 
     Args:
@@ -192,9 +363,8 @@ def create_document(ctx: Context, name: str) -> list[TextContent]:
         }
         ```
     """
-    freecad = get_freecad_connection()
     try:
-        res = freecad.create_document(name)
+        res = await run_rpc("create_document", name)
         if res["success"]:
             return [
                 TextContent(type="text", text=f"Document '{res['document_name']}' created successfully")
@@ -204,14 +374,14 @@ def create_document(ctx: Context, name: str) -> list[TextContent]:
                 TextContent(type="text", text=f"Failed to create document: {res['error']}")
             ]
     except Exception as e:
-        logger.error(f"Failed to create document: {str(e)}")
+        logger.exception("Failed to create document: %s", e)
         return [
             TextContent(type="text", text=f"Failed to create document: {str(e)}")
         ]
 
 
 @mcp.tool()
-def create_object(
+async def create_object(
     ctx: Context,
     doc_name: str,
     obj_type: str,
@@ -334,31 +504,63 @@ def create_object(
         }
         ```
     """
-    freecad = get_freecad_connection()
-    try:
-        obj_data = {"Name": obj_name, "Type": obj_type, "Properties": obj_properties or {}, "Analysis": analysis_name}
-        res = freecad.create_object(doc_name, obj_data)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Object '{res['object_name']}' created successfully"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to create object: {res['error']}"),
+    obj_data = {"Name": obj_name, "Type": obj_type, "Properties": obj_properties or {}, "Analysis": analysis_name}
+    return await run_tool_with_screenshot(
+        "create_object", (doc_name, obj_data), "create object",
+        lambda res: f"Object '{res['object_name']}' created successfully",
+    )
+
+
+@mcp.tool()
+async def create_objects(
+    ctx: Context, doc_name: str, objects: list[dict[str, Any]]
+) -> list[TextContent | ImageContent]:
+    """Create several objects in FreeCAD at once.
+    Prefer this over repeated `create_object` calls when more than one object is needed:
+    all objects are created in one request and the document is recomputed once.
+
+    Args:
+        doc_name: The name of the document to create the objects in.
+        objects: The objects to create. Each entry has the object `Type`, and
+            optionally its `Name`, the `Analysis` to add it to and the
+            `Properties` to set, as in `create_object`.
+
+    Returns:
+        One line per object indicating its success or failure and a screenshot of the objects.
+
+    Examples:
+        If you want to create a box and a cylinder next to it, you can use the following data.
+        ```json
+        {
+            "doc_name": "MyDocument",
+            "objects": [
+                {"Name": "Box", "Type": "Part::Box", "Properties": {"Length": 20}},
+                {"Name": "Cylinder", "Type": "Part::Cylinder",
+                 "Properties": {"Radius": 5, "Placement": {"Base": {"x": 30, "y": 0, "z": 0}}}}
             ]
-            return add_screenshot_if_available(response, screenshot)
+        }
+        ```
+    """
+    try:
+        results, screenshot = await run_rpc("call_with_screenshot", "create_objects", doc_name, objects)
+        response = [
+            TextContent(
+                type="text",
+                text=f"Object '{res['object_name']}' created successfully" if res["success"]
+                else f"Failed to create object '{obj.get('Name')}': {res['error']}",
+            )
+            for obj, res in zip(objects, results)
+        ]
+        return add_screenshot_if_available(response, screenshot)
     except Exception as e:
-        logger.error(f"Failed to create object: {str(e)}")
+        logger.exception("Failed to create objects: %s", e)
         return [
-            TextContent(type="text", text=f"Failed to create object: {str(e)}")
+            TextContent(type="text", text=f"Failed to create objects: {str(e)}")
         ]
 
 
 @mcp.tool()
-def edit_object(
+async def edit_object(
     ctx: Context, doc_name: str, obj_name: str, obj_properties: dict[str, Any]
 ) -> list[TextContent | ImageContent]:
     """Edit an object in FreeCAD.
@@ -372,30 +574,60 @@ def edit_object(
     Returns:
         A message indicating the success or failure of the object editing and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.edit_object(doc_name, obj_name, obj_properties)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Object '{res['object_name']}' edited successfully"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to edit object: {res['error']}"),
+    return await run_tool_with_screenshot(
+        "edit_object", (doc_name, obj_name, obj_properties), "edit object",
+        lambda res: f"Object '{res['object_name']}' edited successfully",
+    )
+
+
+@mcp.tool()
+async def edit_objects(
+    ctx: Context, doc_name: str, edits: list[dict[str, Any]]
+) -> list[TextContent | ImageContent]:
+    """Edit several objects in FreeCAD at once.
+    Prefer this over repeated `edit_object` calls when more than one object changes:
+    all edits are applied in one request and the document is recomputed once.
+
+    Args:
+        doc_name: The name of the document to edit the objects in.
+        edits: The edits to apply. Each entry has the object `Name` and the
+            `Properties` to set on it.
+
+    Returns:
+        One line per edit indicating its success or failure and a screenshot of the objects.
+
+    Examples:
+        If you want to move two boxes, you can use the following data.
+        ```json
+        {
+            "doc_name": "MyDocument",
+            "edits": [
+                {"Name": "Box", "Properties": {"Placement": {"Base": {"x": 10, "y": 0, "z": 0}}}},
+                {"Name": "Box001", "Properties": {"Placement": {"Base": {"x": 0, "y": 10, "z": 0}}}}
             ]
-            return add_screenshot_if_available(response, screenshot)
+        }
+        ```
+    """
+    try:
+        results, screenshot = await run_rpc("call_with_screenshot", "edit_objects", doc_name, edits)
+        response = [
+            TextContent(
+                type="text",
+                text=f"Object '{res['object_name']}' edited successfully" if res["success"]
+                else f"Failed to edit object '{edit.get('Name')}': {res['error']}",
+            )
+            for edit, res in zip(edits, results)
+        ]
+        return add_screenshot_if_available(response, screenshot)
     except Exception as e:
-        logger.error(f"Failed to edit object: {str(e)}")
+        logger.exception("Failed to edit objects: %s", e)
         return [
-            TextContent(type="text", text=f"Failed to edit object: {str(e)}")
+            TextContent(type="text", text=f"Failed to edit objects: {str(e)}")
         ]
 
 
 @mcp.tool()
-def delete_object(ctx: Context, doc_name: str, obj_name: str) -> list[TextContent | ImageContent]:
+async def delete_object(ctx: Context, doc_name: str, obj_name: str) -> list[TextContent | ImageContent]:
     """Delete an object in FreeCAD.
 
     Args:
@@ -405,30 +637,45 @@ def delete_object(ctx: Context, doc_name: str, obj_name: str) -> list[TextConten
     Returns:
         A message indicating the success or failure of the object deletion and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
+    return await run_tool_with_screenshot(
+        "delete_object", (doc_name, obj_name), "delete object",
+        lambda res: f"Object '{res['object_name']}' deleted successfully",
+    )
+
+
+@mcp.tool()
+async def delete_objects(ctx: Context, doc_name: str, obj_names: list[str]) -> list[TextContent | ImageContent]:
+    """Delete several objects in FreeCAD at once.
+    Prefer this over repeated `delete_object` calls: all objects are deleted
+    in one request and the document is recomputed once.
+
+    Args:
+        doc_name: The name of the document to delete the objects from.
+        obj_names: The names of the objects to delete.
+
+    Returns:
+        One line per object indicating its success or failure and a screenshot of the document.
+    """
     try:
-        res = freecad.delete_object(doc_name, obj_name)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Object '{res['object_name']}' deleted successfully"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to delete object: {res['error']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
+        results, screenshot = await run_rpc("call_with_screenshot", "delete_objects", doc_name, obj_names)
+        response = [
+            TextContent(
+                type="text",
+                text=f"Object '{res['object_name']}' deleted successfully" if res["success"]
+                else f"Failed to delete object '{obj_name}': {res['error']}",
+            )
+            for obj_name, res in zip(obj_names, results)
+        ]
+        return add_screenshot_if_available(response, screenshot)
     except Exception as e:
-        logger.error(f"Failed to delete object: {str(e)}")
+        logger.exception("Failed to delete objects: %s", e)
         return [
-            TextContent(type="text", text=f"Failed to delete object: {str(e)}")
+            TextContent(type="text", text=f"Failed to delete objects: {str(e)}")
         ]
 
 
 @mcp.tool()
-def execute_code(ctx: Context, code: str) -> list[TextContent | ImageContent]:
+async def execute_code(ctx: Context, code: str) -> list[TextContent | ImageContent]:
     """Execute arbitrary Python code in FreeCAD.
 
     Args:
@@ -437,30 +684,14 @@ def execute_code(ctx: Context, code: str) -> list[TextContent | ImageContent]:
     Returns:
         A message indicating the success or failure of the code execution, the output of the code execution, and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.execute_code(code)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Code executed successfully: {res['message']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to execute code: {res['error']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to execute code: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to execute code: {str(e)}")
-        ]
+    return await run_tool_with_screenshot(
+        "execute_code", (code,), "execute code",
+        lambda res: f"Code executed successfully: {res['message']}",
+    )
 
 
 @mcp.tool()
-def get_view(ctx: Context, view_name: Literal["Isometric", "Front", "Top", "Right", "Back", "Left", "Bottom", "Dimetric", "Trimetric"]) -> list[ImageContent | TextContent]:
+async def get_view(ctx: Context, view_name: Literal["Isometric", "Front", "Top", "Right", "Back", "Left", "Bottom", "Dimetric", "Trimetric"]) -> list[ImageContent | TextContent]:
     """Get a screenshot of the active view.
 
     Args:
@@ -479,17 +710,16 @@ def get_view(ctx: Context, view_name: Literal["Isometric", "Front", "Top", "Righ
     Returns:
         A screenshot of the active view.
     """
-    freecad = get_freecad_connection()
-    screenshot = freecad.get_active_screenshot(view_name)
+    screenshot = await run_rpc("get_active_screenshot", view_name)
     
     if screenshot is not None:
-        return [ImageContent(type="image", data=screenshot, mimeType="image/png")]
+        return [ImageContent(type="image", data=screenshot, mimeType=_VIEW_SCREENSHOT_MIME_TYPE)]
     else:
         return [TextContent(type="text", text="Cannot get screenshot in the current view type (such as TechDraw or Spreadsheet)")]
 
 
 @mcp.tool()
-def insert_part_from_library(ctx: Context, relative_path: str) -> list[TextContent | ImageContent]:
+async def insert_part_from_library(ctx: Context, relative_path: str) -> list[TextContent | ImageContent]:
     """Insert a part from the parts library addon.
 
     Args:
@@ -498,55 +728,48 @@ def insert_part_from_library(ctx: Context, relative_path: str) -> list[TextConte
     Returns:
         A message indicating the success or failure of the part insertion and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
-    try:
-        res = freecad.insert_part_from_library(relative_path)
-        screenshot = freecad.get_active_screenshot()
-        
-        if res["success"]:
-            response = [
-                TextContent(type="text", text=f"Part inserted from library: {res['message']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-        else:
-            response = [
-                TextContent(type="text", text=f"Failed to insert part from library: {res['error']}"),
-            ]
-            return add_screenshot_if_available(response, screenshot)
-    except Exception as e:
-        logger.error(f"Failed to insert part from library: {str(e)}")
-        return [
-            TextContent(type="text", text=f"Failed to insert part from library: {str(e)}")
-        ]
+    return await run_tool_with_screenshot(
+        "insert_part_from_library", (relative_path,), "insert part from library",
+        lambda res: f"Part inserted from library: {res['message']}",
+    )
 
 
 @mcp.tool()
-def get_objects(ctx: Context, doc_name: str) -> list[dict[str, Any]]:
-    """Get all objects in a document.
+async def get_objects(
+    ctx: Context, doc_name: str, obj_names: list[str] | None = None
+) -> list[dict[str, Any]]:
+    """Get all objects in a document, or only the named ones.
     You can use this tool to get the objects in a document to see what you can check or edit.
+    Pass `obj_names` instead of calling `get_object` repeatedly: the named objects
+    are read in one request.
 
     Args:
         doc_name: The name of the document to get the objects from.
+        obj_names: The names of the objects to get. All objects are returned when omitted.
 
     Returns:
-        A list of objects in the document and a screenshot of the document.
+        A list of objects in the document, or a mapping from each requested name
+        to its object (null if the document has none of that name), and a screenshot
+        of the document.
     """
-    freecad = get_freecad_connection()
     try:
-        screenshot = freecad.get_active_screenshot()
+        if obj_names is None:
+            objects, screenshot = await run_rpc("call_with_screenshot", "get_objects", doc_name)
+        else:
+            objects, screenshot = await run_rpc("call_with_screenshot", "get_objects_bulk", doc_name, obj_names)
         response = [
-            TextContent(type="text", text=json.dumps(freecad.get_objects(doc_name))),
+            TextContent(type="text", text=dumps_str(objects)),
         ]
         return add_screenshot_if_available(response, screenshot)
     except Exception as e:
-        logger.error(f"Failed to get objects: {str(e)}")
+        logger.exception("Failed to get objects: %s", e)
         return [
             TextContent(type="text", text=f"Failed to get objects: {str(e)}")
         ]
 
 
 @mcp.tool()
-def get_object(ctx: Context, doc_name: str, obj_name: str) -> dict[str, Any]:
+async def get_object(ctx: Context, doc_name: str, obj_name: str) -> dict[str, Any]:
     """Get an object from a document.
     You can use this tool to get the properties of an object to see what you can check or edit.
 
@@ -557,29 +780,27 @@ def get_object(ctx: Context, doc_name: str, obj_name: str) -> dict[str, Any]:
     Returns:
         The object and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
     try:
-        screenshot = freecad.get_active_screenshot()
+        obj, screenshot = await run_rpc("call_with_screenshot", "get_object", doc_name, obj_name)
         response = [
-            TextContent(type="text", text=json.dumps(freecad.get_object(doc_name, obj_name))),
+            TextContent(type="text", text=dumps_str(obj)),
         ]
         return add_screenshot_if_available(response, screenshot)
     except Exception as e:
-        logger.error(f"Failed to get object: {str(e)}")
+        logger.exception("Failed to get object: %s", e)
         return [
             TextContent(type="text", text=f"Failed to get object: {str(e)}")
         ]
 
 
 @mcp.tool()
-def get_parts_list(ctx: Context) -> list[str]:
+async def get_parts_list(ctx: Context) -> list[str]:
     """Get the list of parts in the parts library addon.
     """
-    freecad = get_freecad_connection()
-    parts = freecad.get_parts_list()
+    parts = await run_rpc("get_parts_list")
     if parts:
         return [
-            TextContent(type="text", text=json.dumps(parts))
+            TextContent(type="text", text=dumps_str(parts))
         ]
     else:
         return [
@@ -588,7 +809,7 @@ def get_parts_list(ctx: Context) -> list[str]:
 
 
 @mcp.tool()
-def mcp_freecad_nodes_create_node(ctx: Context, node_type_op_code: str, title: str | None = None, x_pos: float = 0.0, y_pos: float = 0.0) -> list[TextContent | ImageContent]:
+async def mcp_freecad_nodes_create_node(ctx: Context, node_type_op_code: str, title: str | None = None, x_pos: float = 0.0, y_pos: float = 0.0) -> list[TextContent | ImageContent]:
     """Create a new node in the FreeCAD Nodes workbench.
 
     Args:
@@ -618,10 +839,11 @@ def mcp_freecad_nodes_create_node(ctx: Context, node_type_op_code: str, title: s
         }
         ```
     """
-    freecad = get_freecad_connection()
     response_content = []
     try:
-        res = freecad.nodes_create_node(node_type_op_code, title, x_pos, y_pos)
+        res, screenshot = await run_rpc(
+            "call_with_nodes_screenshot", "nodes_create_node", node_type_op_code, title, x_pos, y_pos
+        )
         if res["success"]:
             response_content.append(
                 TextContent(type="text", text=f"Node '{res.get('title', 'N/A')}' (ID: {res.get('node_id', 'N/A')}) created successfully: {res.get('message', '')}")
@@ -631,29 +853,75 @@ def mcp_freecad_nodes_create_node(ctx: Context, node_type_op_code: str, title: s
                 TextContent(type="text", text=f"Failed to create node: {res.get('message', 'Unknown error')}")
             )
     except Exception as e:
-        logger.error(f"MCP tool mcp_freecad_nodes_create_node failed: {str(e)}")
+        logger.exception("MCP tool mcp_freecad_nodes_create_node failed: %s", e)
         response_content.append(
             TextContent(type="text", text=f"An error occurred while creating the node: {str(e)}")
         )
         # Attempt to get screenshot even if node creation failed, to show current state
         try:
-            screenshot = freecad.get_nodes_workbench_screenshot()
+            screenshot = await fetch_screenshot("get_nodes_workbench_screenshot")
             add_nodes_screenshot_if_available(response_content, screenshot)
         except Exception as se:
-            logger.error(f"Failed to get nodes workbench screenshot after node creation error: {str(se)}")
+            logger.error("Failed to get nodes workbench screenshot after node creation error: %s", se)
             if not _only_text_feedback: # Add message only if visual feedback was expected
                 response_content.append(TextContent(type="text", text="Nodes workbench screenshot could not be retrieved due to an additional error during error handling."))
         return response_content
 
-    # Try to get screenshot after successful or failed attempt (if no exception above)
+    # The screenshot was taken in the same request, after the attempt
+    add_nodes_screenshot_if_available(response_content, screenshot)
+    return response_content
+
+
+@mcp.tool()
+async def mcp_freecad_nodes_create_nodes(ctx: Context, nodes: list[dict[str, Any]]) -> list[TextContent | ImageContent]:
+    """Create several nodes in the FreeCAD Nodes workbench at once.
+    Prefer this over repeated `mcp_freecad_nodes_create_node` calls when building a graph:
+    all nodes are created in one request and recorded as a single undo step.
+
+    Args:
+        nodes: The nodes to create. Each entry takes the same keys as the
+            `mcp_freecad_nodes_create_node` arguments: `node_type_op_code`
+            (required), `title`, `x_pos` and `y_pos`.
+
+    Returns:
+        One line per node indicating the success or failure of its creation,
+        and a screenshot of the Nodes workbench if available.
+
+    Examples:
+        To create a 'Number' node and an 'Arithmetic' node side by side:
+        ```json
+        {
+            "nodes": [
+                {"node_type_op_code": "<class 'generators_primitives_number.Number'>", "title": "A", "x_pos": 0.0, "y_pos": 0.0},
+                {"node_type_op_code": "<class 'operators_arithmetic.Arithmetic'>", "x_pos": 200.0, "y_pos": 0.0}
+            ]
+        }
+        ```
+    """
+    response_content = []
     try:
-        screenshot = freecad.get_nodes_workbench_screenshot()
-        add_nodes_screenshot_if_available(response_content, screenshot)
+        results, screenshot = await run_rpc("call_with_nodes_screenshot", "nodes_create_nodes", nodes)
+        for spec, res in zip(nodes, results):
+            if res["success"]:
+                text = f"Node '{res.get('title', 'N/A')}' (ID: {res.get('node_id', 'N/A')}) created successfully"
+            else:
+                text = f"Failed to create node {spec.get('node_type_op_code')}: {res.get('message', 'Unknown error')}"
+            response_content.append(TextContent(type="text", text=text))
     except Exception as e:
-        logger.error(f"Failed to get nodes workbench screenshot: {str(e)}")
-        if not _only_text_feedback: # Add message only if visual feedback was expected
-            response_content.append(TextContent(type="text", text="Failed to retrieve Nodes workbench screenshot due to an error."))
+        logger.exception("MCP tool mcp_freecad_nodes_create_nodes failed: %s", e)
+        response_content.append(
+            TextContent(type="text", text=f"An error occurred while creating the nodes: {str(e)}")
+        )
+        # Attempt to get screenshot even if node creation failed, to show current state
+        try:
+            screenshot = await fetch_screenshot("get_nodes_workbench_screenshot")
+        except Exception as se:
+            logger.error("Failed to get nodes workbench screenshot: %s", se)
+            if not _only_text_feedback: # Add message only if visual feedback was expected
+                response_content.append(TextContent(type="text", text="Failed to retrieve Nodes workbench screenshot due to an error."))
+            return response_content
 
+    add_nodes_screenshot_if_available(response_content, screenshot)
     return response_content
 
 
@@ -671,14 +939,17 @@ When creating content in FreeCAD, always follow these steps:
    - If the required part exists in the library, use insert_part_from_library() to insert it into your document.
 
 2. If the appropriate asset is not available in the parts library:
-   - Create basic shapes (e.g., cubes, cylinders, spheres) using create_object().
-   - Adjust and define detailed properties of the shapes as necessary using edit_object().
+   - Create basic shapes (e.g., cubes, cylinders, spheres) using create_object(),
+     or create_objects() when several are needed at once.
+   - Adjust and define detailed properties of the shapes as necessary using edit_object(),
+     or edit_objects() when several objects change at once.
 
 3. Always assign clear and descriptive names to objects when adding them to the document.
 
-4. Explicitly set the position, scale, and rotation properties of created or inserted objects using edit_object() to ensure proper spatial relationships.
+4. Explicitly set the position, scale, and rotation properties of created or inserted objects using edit_object() (or edit_objects() for several objects) to ensure proper spatial relationships.
 
-5. After editing an object, always verify that the set properties have been correctly applied by using get_object().
+5. After editing an object, always verify that the set properties have been correctly applied by using get_object(),
+   or get_objects() with obj_names when several objects were edited.
 
 6. If detailed customization or specialized operations are necessary, use execute_code() to run custom Python scripts.
 
@@ -691,11 +962,14 @@ Only revert to basic creation methods in the following cases:
 
 def main():
     """Run the MCP server"""
-    global _only_text_feedback
+    global _only_text_feedback, _use_json_rpc
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("--only-text-feedback", action="store_true", help="Only return text feedback")
+    parser.add_argument("--json-rpc", action="store_true", help="Talk to FreeCAD over JSON-RPC instead of XML-RPC")
     args = parser.parse_args()
     _only_text_feedback = args.only_text_feedback
-    logger.info(f"Only text feedback: {_only_text_feedback}")
+    _use_json_rpc = args.json_rpc
+    logger.info("Only text feedback: %s", _only_text_feedback)
+    logger.info("JSON-RPC transport: %s", _use_json_rpc)
     mcp.run()
\ No newline at end of file